@@ -15,6 +15,9 @@ export async function POST(request: NextRequest) {
     const { count = COLLECTION_LIMITS.IDEAS_DAILY, category } = await request.json().catch(() => ({}));
 
     console.log('🎯 Generating idea from trending pain points...');
+
+    // DB 조회 동안 OpenRouter 연결을 미리 열어 둠
+    openaiService.warmup();
     
     // 실제 트렌딩 갈증포인트들 가져오기
     const trendingPainPoints = await PainPointService.getTrending(count);
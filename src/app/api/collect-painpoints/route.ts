@@ -3,7 +3,8 @@ import { redditService } from '@/lib/services/reddit-service';
 import { PainPointService } from '@/lib/database';
 import { createSuccessResponse, createErrorResponse, type PainPointCollectionData } from '@/lib/types/api';
 import { handleError } from '@/lib/error-handler';
-import { COLLECTION_LIMITS, STATUS_MESSAGES } from '@/lib/constants';
+import { COLLECTION_LIMITS, DB_QUERY_LIMITS, STATUS_MESSAGES } from '@/lib/constants';
+import { mapWithConcurrency } from '@/lib/collections';
 
 // Use Node.js runtime for better compatibility with external APIs
 export const runtime = 'nodejs';
@@ -24,12 +25,11 @@ export async function POST(request: NextRequest) {
     
     console.log(`📊 Collected ${painPoints.length} pain points from Reddit`);
     
-    // 수집된 갈증포인트들을 데이터베이스에 저장
-    const savedPainPoints = [];
+    // 수집된 갈증포인트들을 데이터베이스에 저장 (동시 INSERT 개수 제한, 순서 유지)
     let successCount = 0;
     let errorCount = 0;
     
-    for (const painPoint of painPoints) {
+    const savedPainPoints = await mapWithConcurrency(painPoints, DB_QUERY_LIMITS.SAVE_CONCURRENCY, async (painPoint) => {
       try {
         const saved = await PainPointService.create({
           title: painPoint.title,
@@ -41,20 +41,20 @@ export async function POST(request: NextRequest) {
           keywords: painPoint.keywords,
           category: painPoint.category
         });
-        savedPainPoints.push(saved);
         successCount++;
+        return saved;
       } catch (error) {
         console.error('Failed to save pain point:', error);
         errorCount++;
         // 저장 실패한 항목도 응답에 포함 (개발용)
-        savedPainPoints.push({
+        return {
           ...painPoint,
           id: `temp_${Date.now()}_${Math.random()}`,
           created_at: new Date().toISOString(),
           error: 'Failed to save to database'
-        });
+        };
       }
-    }
+    });
 
     const responseData: PainPointCollectionData = {
       painPoints: savedPainPoints,
@@ -8,6 +8,45 @@ const supabase = createClient(
   process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!
 );
 
+// 미리 정의된 태그 목록 (요청마다 다시 만들지 않도록 모듈 상수로 유지)
+const PREDEFINED_TAGS: ReadonlyArray<{ name: string; category: string; count: number }> = [
+  // 기술 스택
+  { name: 'React', category: 'tech', count: 0 },
+  { name: 'Next.js', category: 'tech', count: 0 },
+  { name: 'TypeScript', category: 'tech', count: 0 },
+  { name: 'Python', category: 'tech', count: 0 },
+  { name: 'Node.js', category: 'tech', count: 0 },
+  { name: 'JavaScript', category: 'tech', count: 0 },
+  { name: 'AI/ML', category: 'tech', count: 0 },
+  { name: 'GPT', category: 'tech', count: 0 },
+  
+  // 프로젝트 유형
+  { name: 'SaaS', category: 'project', count: 0 },
+  { name: '모바일앱', category: 'project', count: 0 },
+  { name: '웹사이트', category: 'project', count: 0 },
+  { name: 'API', category: 'project', count: 0 },
+  { name: '대시보드', category: 'project', count: 0 },
+  { name: 'E-commerce', category: 'project', count: 0 },
+  { name: '소셜미디어', category: 'project', count: 0 },
+  
+  // 분야
+  { name: '핀테크', category: 'domain', count: 0 },
+  { name: '헬스케어', category: 'domain', count: 0 },
+  { name: '교육', category: 'domain', count: 0 },
+  { name: '게임', category: 'domain', count: 0 },
+  { name: '커머스', category: 'domain', count: 0 },
+  { name: '생산성', category: 'domain', count: 0 },
+  { name: '엔터테인먼트', category: 'domain', count: 0 },
+  
+  // 상태
+  { name: '기획중', category: 'status', count: 0 },
+  { name: '개발중', category: 'status', count: 0 },
+  { name: '완료', category: 'status', count: 0 },
+  { name: '런칭', category: 'status', count: 0 },
+  { name: 'MVP', category: 'status', count: 0 },
+  { name: '베타', category: 'status', count: 0 }
+];
+
 // GET /api/community/tags - 태그 목록 조회
 export async function GET(request: NextRequest) {
   try {
@@ -54,46 +93,9 @@ export async function GET(request: NextRequest) {
 
     } else {
       // 미리 정의된 태그 목록 반환
-      const predefinedTags = [
-        // 기술 스택
-        { name: 'React', category: 'tech', count: 0 },
-        { name: 'Next.js', category: 'tech', count: 0 },
-        { name: 'TypeScript', category: 'tech', count: 0 },
-        { name: 'Python', category: 'tech', count: 0 },
-        { name: 'Node.js', category: 'tech', count: 0 },
-        { name: 'JavaScript', category: 'tech', count: 0 },
-        { name: 'AI/ML', category: 'tech', count: 0 },
-        { name: 'GPT', category: 'tech', count: 0 },
-        
-        // 프로젝트 유형
-        { name: 'SaaS', category: 'project', count: 0 },
-        { name: '모바일앱', category: 'project', count: 0 },
-        { name: '웹사이트', category: 'project', count: 0 },
-        { name: 'API', category: 'project', count: 0 },
-        { name: '대시보드', category: 'project', count: 0 },
-        { name: 'E-commerce', category: 'project', count: 0 },
-        { name: '소셜미디어', category: 'project', count: 0 },
-        
-        // 분야
-        { name: '핀테크', category: 'domain', count: 0 },
-        { name: '헬스케어', category: 'domain', count: 0 },
-        { name: '교육', category: 'domain', count: 0 },
-        { name: '게임', category: 'domain', count: 0 },
-        { name: '커머스', category: 'domain', count: 0 },
-        { name: '생산성', category: 'domain', count: 0 },
-        { name: '엔터테인먼트', category: 'domain', count: 0 },
-        
-        // 상태
-        { name: '기획중', category: 'status', count: 0 },
-        { name: '개발중', category: 'status', count: 0 },
-        { name: '완료', category: 'status', count: 0 },
-        { name: '런칭', category: 'status', count: 0 },
-        { name: 'MVP', category: 'status', count: 0 },
-        { name: '베타', category: 'status', count: 0 }
-      ];
 
       return NextResponse.json(createSuccessResponse({
-        tags: predefinedTags.slice(0, limit)
+        tags: PREDEFINED_TAGS.slice(0, limit)
       }));
     }
 
@@ -160,17 +162,23 @@ export async function POST(request: NextRequest) {
   }
 }
 
+// 카테고리별 알려진 태그 (앞선 카테고리가 우선)
+const TAG_GROUPS: Record<string, string[]> = {
+  tech: ['React', 'Next.js', 'TypeScript', 'Python', 'Node.js', 'JavaScript', 'AI/ML', 'GPT', 'Vue', 'Angular', 'PHP', 'Java', 'C++', 'Swift', 'Kotlin'],
+  project: ['SaaS', '모바일앱', '웹사이트', 'API', '대시보드', 'E-commerce', '소셜미디어'],
+  domain: ['핀테크', '헬스케어', '교육', '게임', '커머스', '생산성', '엔터테인먼트'],
+  status: ['기획중', '개발중', '완료', '런칭', 'MVP', '베타']
+};
+
+// 태그 이름 → 카테고리 조회 테이블 (모듈 로드 시 한 번만 구성)
+const TAG_CATEGORIES = new Map<string, string>();
+Object.entries(TAG_GROUPS).forEach(([category, tags]) => {
+  tags.forEach(tag => {
+    if (!TAG_CATEGORIES.has(tag)) TAG_CATEGORIES.set(tag, category);
+  });
+});
+
 // Helper function to categorize tags
 function getTagCategory(tagName: string): string {
-  const techTags = ['React', 'Next.js', 'TypeScript', 'Python', 'Node.js', 'JavaScript', 'AI/ML', 'GPT', 'Vue', 'Angular', 'PHP', 'Java', 'C++', 'Swift', 'Kotlin'];
-  const projectTags = ['SaaS', '모바일앱', '웹사이트', 'API', '대시보드', 'E-commerce', '소셜미디어'];
-  const domainTags = ['핀테크', '헬스케어', '교육', '게임', '커머스', '생산성', '엔터테인먼트'];
-  const statusTags = ['기획중', '개발중', '완료', '런칭', 'MVP', '베타'];
-
-  if (techTags.includes(tagName)) return 'tech';
-  if (projectTags.includes(tagName)) return 'project';
-  if (domainTags.includes(tagName)) return 'domain';
-  if (statusTags.includes(tagName)) return 'status';
-  
-  return 'custom';
-}
\ No newline at end of file
+  return TAG_CATEGORIES.get(tagName) ?? 'custom';
+}
@@ -1,9 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { createSuccessResponse, createErrorResponse } from '@/lib/types/api';
 import { AppError, ErrorFactory } from '@/lib/error-handler';
-import { OpenAIService } from '@/lib/services/openai-service';
-
-const openaiService = new OpenAIService();
+import { openaiService } from '@/lib/services/openai-service';
 
 interface PRDGenerationRequest {
   title: string;
@@ -83,7 +81,7 @@ export async function POST(request: NextRequest) {
     });
 
     // Mermaid 다이어그램 생성
-    const diagrams = await generateMermaidDiagrams(generatedPRD, template_type);
+    const diagrams = generateMermaidDiagrams(generatedPRD, template_type);
 
     const result: GeneratedPRD = {
       ...generatedPRD,
@@ -194,11 +192,14 @@ Please generate a comprehensive PRD with the following sections in JSON format:
 Generate the PRD now:`;
 }
 
+// AI 응답의 JSON 코드 블록
+const JSON_BLOCK_PATTERN = /```json\n([\s\S]*?)\n```/;
+
 // AI 응답을 PRD 구조로 파싱
 function parsePRDResponse(aiResponse: string, metadata: any): Omit<GeneratedPRD, 'diagrams' | 'metadata'> {
   try {
     // JSON 블록 추출
-    const jsonMatch = aiResponse.match(/```json\n([\s\S]*?)\n```/);
+    const jsonMatch = aiResponse.match(JSON_BLOCK_PATTERN);
     if (!jsonMatch) {
       throw new Error('No JSON block found in AI response');
     }
@@ -243,7 +244,7 @@ function parsePRDResponse(aiResponse: string, metadata: any): Omit<GeneratedPRD,
 }
 
 // Mermaid 다이어그램 생성
-async function generateMermaidDiagrams(prd: any, templateType: string): Promise<string[]> {
+function generateMermaidDiagrams(prd: any, templateType: string): string[] {
   const diagrams: string[] = [];
   
   try {
@@ -122,9 +122,11 @@ export default function CommunityPage() {
 
   const popularTags = ['협업', '자랑', 'AI', 'SaaS', '외주', '모바일', 'B2B', '성공사례'];
 
+  const normalizedQuery = searchQuery.toLowerCase();
+
   const filteredPosts = posts.filter(post => {
-    const matchesSearch = post.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-                         post.content.toLowerCase().includes(searchQuery.toLowerCase());
+    const matchesSearch = post.title.toLowerCase().includes(normalizedQuery) ||
+                         post.content.toLowerCase().includes(normalizedQuery);
     const matchesCategory = selectedCategory === 'all' || post.category === selectedCategory;
     const matchesTag = !selectedTag || post.tags.some(tag => tag.includes(selectedTag));
     
@@ -298,22 +298,25 @@ export default function ProjectMatchingPage() {
     );
   };
 
+  const normalizedQuery = searchQuery.toLowerCase();
+  const selectedSkillSet = new Set(selectedSkills);
+
   const filteredProjects = projects.filter(project => {
-    const matchesSearch = project.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-                         project.description.toLowerCase().includes(searchQuery.toLowerCase());
+    const matchesSearch = project.title.toLowerCase().includes(normalizedQuery) ||
+                         project.description.toLowerCase().includes(normalizedQuery);
     const matchesCategory = selectedCategory === 'all' || project.category === selectedCategory;
     const matchesSkills = selectedSkills.length === 0 || 
-                         selectedSkills.some(skill => project.skills.includes(skill));
+                         project.skills.some(skill => selectedSkillSet.has(skill));
     
     return matchesSearch && matchesCategory && matchesSkills;
   });
 
   const filteredFreelancers = freelancers.filter(freelancer => {
-    const matchesSearch = freelancer.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-                         freelancer.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-                         freelancer.description.toLowerCase().includes(searchQuery.toLowerCase());
+    const matchesSearch = freelancer.name.toLowerCase().includes(normalizedQuery) ||
+                         freelancer.title.toLowerCase().includes(normalizedQuery) ||
+                         freelancer.description.toLowerCase().includes(normalizedQuery);
     const matchesSkills = selectedSkills.length === 0 || 
-                         selectedSkills.some(skill => freelancer.skills.includes(skill));
+                         freelancer.skills.some(skill => selectedSkillSet.has(skill));
     
     return matchesSearch && matchesSkills;
   });
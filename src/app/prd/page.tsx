@@ -68,9 +68,11 @@ export default function PRDListPage() {
     }, 1000);
   }, []);
 
+  const normalizedQuery = searchQuery.toLowerCase();
+
   const filteredPrds = prds.filter(prd =>
-    prd.title.toLowerCase().includes(searchQuery.toLowerCase()) ||
-    prd.description.toLowerCase().includes(searchQuery.toLowerCase())
+    prd.title.toLowerCase().includes(normalizedQuery) ||
+    prd.description.toLowerCase().includes(normalizedQuery)
   );
 
   const getStatusBadge = (status: string) => {
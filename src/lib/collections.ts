@@ -0,0 +1,80 @@
+/**
+ * 컬렉션 처리 유틸리티
+ * UI 의존성(clsx, tailwind-merge) 없이 서버/엣지 코드에서 공통으로 사용
+ */
+
+/**
+ * 점수 기준 상위 k개 선택 (내림차순, 동점은 원래 순서 유지)
+ * 전체 정렬 대신 크기 k의 최소 힙을 사용해 O(n log k)로 처리
+ */
+export function selectTopK<T>(items: readonly T[], k: number, score: (item: T) => number): T[] {
+  if (k <= 0) return [];
+
+  // 더 "약한" 항목: 점수가 낮거나, 동점이면 나중에 등장한 항목
+  const weaker = (a: number, b: number, scores: number[]) =>
+    scores[a] < scores[b] || (scores[a] === scores[b] && a > b);
+
+  const scores = items.map(score);
+  const heap: number[] = [];
+
+  const siftUp = (i: number) => {
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (!weaker(heap[i], heap[parent], scores)) break;
+      [heap[i], heap[parent]] = [heap[parent], heap[i]];
+      i = parent;
+    }
+  };
+
+  const siftDown = (i: number) => {
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let weakest = i;
+      if (left < heap.length && weaker(heap[left], heap[weakest], scores)) weakest = left;
+      if (right < heap.length && weaker(heap[right], heap[weakest], scores)) weakest = right;
+      if (weakest === i) break;
+      [heap[i], heap[weakest]] = [heap[weakest], heap[i]];
+      i = weakest;
+    }
+  };
+
+  for (let i = 0; i < items.length; i++) {
+    if (heap.length < k) {
+      heap.push(i);
+      siftUp(heap.length - 1);
+    } else if (weaker(heap[0], i, scores)) {
+      heap[0] = i;
+      siftDown(0);
+    }
+  }
+
+  return heap
+    .sort((a, b) => scores[b] - scores[a] || a - b)
+    .map(index => items[index]);
+}
+
+/**
+ * 동시 실행 개수를 제한한 비동기 map (결과는 입력 순서 유지)
+ * 작업자 concurrency개가 다음 인덱스를 가져가며 처리
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  concurrency: number,
+  mapper: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let nextIndex = 0;
+
+  const worker = async () => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await mapper(items[index], index);
+    }
+  };
+
+  const workerCount = Math.min(Math.max(concurrency, 1), items.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+
+  return results;
+}
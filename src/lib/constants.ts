@@ -23,6 +23,8 @@ export const COLLECTION_LIMITS = {
   DASHBOARD_TOP_IDEAS: 3 as number,
   /** 대시보드 표시용 트렌딩 갈증포인트 개수 */
   DASHBOARD_TRENDING_POINTS: 5 as number,
+  /** 게시물 분석 결과 캐시 최대 개수 */
+  POST_ANALYSIS_CACHE_SIZE: 500 as number,
 };
 
 /**
@@ -157,6 +159,8 @@ export const DB_QUERY_LIMITS = {
   RECENT_IDEAS: 5,
   /** 사용자별 최대 저장 가능 아이디어 수 */
   MAX_SAVED_PER_USER: 100,
+  /** 수집 결과 저장 시 동시 INSERT 최대 개수 */
+  SAVE_CONCURRENCY: 5,
 } as const;
 
 /**
@@ -171,6 +175,24 @@ export const API_TIMEOUTS = {
   TELEGRAM_API: 5000, // 5초
   /** 데이터베이스 쿼리 타임아웃 */
   DATABASE_QUERY: 5000, // 5초
+  /** fetch 연결 풀의 유휴 연결 유지 시간 (undici 기본값, 지나면 연결이 닫힘) */
+  KEEP_ALIVE_IDLE: 4000, // 4초
+} as const;
+
+/**
+ * 외부 API 호출 간격 및 재시도 설정
+ */
+export const API_RATE_LIMITS = {
+  /** Reddit 서브레딧 요청 시작 간 최소 간격 */
+  REDDIT_REQUEST_INTERVAL: 1000, // 1초
+  /** OpenRouter Retry-After 헤더를 따라 기다릴 수 있는 최대 시간 (밀리초) */
+  OPENROUTER_MAX_WAIT: 30000, // 30초
+  /** OpenRouter 일시적 오류(429/5xx/네트워크) 최대 재시도 횟수 */
+  OPENROUTER_MAX_RETRIES: 2,
+  /** OpenRouter 재시도 백오프 기본 간격 (밀리초, 시도마다 2배) */
+  OPENROUTER_RETRY_BASE_DELAY: 1000, // 1초
+  /** OpenRouter 재시도 백오프 최대 간격 (밀리초) */
+  OPENROUTER_RETRY_MAX_DELAY: 8000, // 8초
 } as const;
 
 /**
@@ -232,6 +254,10 @@ export const ENDPOINTS = {
   LOCAL_API: 'http://localhost:3000',
   /** 웹사이트 URL */
   WEBSITE_URL: 'https://ideaspark-v2.vercel.app',
+  /** OpenRouter Chat Completions API */
+  OPENROUTER_CHAT_COMPLETIONS: 'https://openrouter.ai/api/v1/chat/completions',
+  /** OpenRouter 모델 목록 API (연결 예열용) */
+  OPENROUTER_MODELS: 'https://openrouter.ai/api/v1/models',
 } as const;
 
 /**
@@ -1,5 +1,6 @@
 import { supabase } from './supabase';
 import type { Tables, Inserts, Updates } from './supabase';
+import { selectTopK } from './collections';
 
 // Pain Points Operations
 export class PainPointService {
@@ -215,15 +216,20 @@ export class TelegramService {
     
     if (error) throw error;
     
+    // Count successes and message types in a single pass
+    let successful = 0;
+    const byType: Record<string, number> = {};
+    for (const msg of data) {
+      if (msg.success) successful++;
+      byType[msg.message_type] = (byType[msg.message_type] || 0) + 1;
+    }
+    
     return {
       total: data.length,
-      successful: data.filter(m => m.success).length,
-      failed: data.filter(m => !m.success).length,
-      successRate: data.length > 0 ? (data.filter(m => m.success).length / data.length) * 100 : 0,
-      byType: data.reduce((acc, msg) => {
-        acc[msg.message_type] = (acc[msg.message_type] || 0) + 1;
-        return acc;
-      }, {} as Record<string, number>)
+      successful,
+      failed: data.length - successful,
+      successRate: data.length > 0 ? (successful / data.length) * 100 : 0,
+      byType
     };
   }
 
@@ -364,29 +370,61 @@ export class AnalyticsService {
         supabase.from('community_posts').select('id, created_at').gte('created_at', startDate.toISOString())
       ]);
 
-      // Group by date
-      const analytics = [];
+      // Group by date: one bucket of running counters per day
+      const dates: string[] = [];
+      const buckets = new Map<string, {
+        pain_points_collected: number;
+        business_ideas_generated: number;
+        telegram_messages_sent: number;
+        community_posts_created: number;
+        confidence_total: number;
+      }>();
       for (let i = 0; i < days; i++) {
         const date = new Date();
         date.setDate(date.getDate() - i);
         const dateStr = date.toISOString().split('T')[0];
         
-        analytics.push({
-          date: dateStr,
-          pain_points_collected: painPoints.data?.filter(p => p.created_at.startsWith(dateStr)).length || 0,
-          business_ideas_generated: businessIdeas.data?.filter(b => b.created_at.startsWith(dateStr)).length || 0,
-          telegram_messages_sent: telegramMessages.data?.filter(t => t.sent_at?.startsWith(dateStr)).length || 0,
-          community_posts_created: communityPosts.data?.filter(c => c.created_at.startsWith(dateStr)).length || 0,
-          avg_confidence_score: (() => {
-            const dayIdeas = businessIdeas.data?.filter(b => b.created_at.startsWith(dateStr)) || [];
-            if (dayIdeas.length === 0) return 0;
-            const totalScore = dayIdeas.reduce((sum, b) => sum + (b.confidence_score || 0), 0);
-            return totalScore / dayIdeas.length;
-          })()
-        });
+        dates.push(dateStr);
+        if (!buckets.has(dateStr)) {
+          buckets.set(dateStr, {
+            pain_points_collected: 0,
+            business_ideas_generated: 0,
+            telegram_messages_sent: 0,
+            community_posts_created: 0,
+            confidence_total: 0
+          });
+        }
       }
       
-      return analytics;
+      // Single pass over each result set (timestamps are ISO strings, so the first 10 chars are the date)
+      painPoints.data?.forEach(p => {
+        const bucket = buckets.get(p.created_at.slice(0, 10));
+        if (bucket) bucket.pain_points_collected++;
+      });
+      businessIdeas.data?.forEach(b => {
+        const bucket = buckets.get(b.created_at.slice(0, 10));
+        if (bucket) {
+          bucket.business_ideas_generated++;
+          bucket.confidence_total += b.confidence_score || 0;
+        }
+      });
+      telegramMessages.data?.forEach(t => {
+        const bucket = t.sent_at ? buckets.get(t.sent_at.slice(0, 10)) : undefined;
+        if (bucket) bucket.telegram_messages_sent++;
+      });
+      communityPosts.data?.forEach(c => {
+        const bucket = buckets.get(c.created_at.slice(0, 10));
+        if (bucket) bucket.community_posts_created++;
+      });
+      
+      return dates.map(date => {
+        const { confidence_total, ...counts } = buckets.get(date)!;
+        return {
+          date,
+          ...counts,
+          avg_confidence_score: counts.business_ideas_generated > 0 ? confidence_total / counts.business_ideas_generated : 0
+        };
+      });
     } catch (error) {
       // Database tables don't exist yet, return sample daily analytics
       const analytics = [];
@@ -477,11 +515,11 @@ export class AnalyticsService {
         });
       });
       
-      // Convert to trending format and sort by frequency
-      return Array.from(keywordCount.entries())
-        .map(([keyword, count]) => ({ keyword, count, trend_score: count / (painPoints?.length || 1) }))
-        .sort((a, b) => b.count - a.count)
-        .slice(0, 20);
+      // Keep only the 20 most frequent keywords (bounded heap, no full sort)
+      const topKeywords = selectTopK(Array.from(keywordCount.entries()), 20, ([, count]) => count);
+      
+      // Convert to trending format
+      return topKeywords.map(([keyword, count]) => ({ keyword, count, trend_score: count / (painPoints?.length || 1) }));
     } catch (error) {
       // Return sample trending keywords
       return [
@@ -0,0 +1,94 @@
+/**
+ * 다중 키워드 매처 (Aho–Corasick)
+ * 여러 키워드의 포함 여부를 텍스트 한 번 스캔으로 판별
+ */
+
+export class KeywordMatcher {
+  /** 노드별 전이 테이블 (문자 → 다음 노드) */
+  private readonly transitions: Array<Map<string, number>> = [new Map()];
+  /** 노드별 실패 링크 */
+  private readonly failure: number[] = [0];
+  /** 노드에서 끝나는 키워드 인덱스 (실패 링크 출력 포함) */
+  private readonly outputs: number[][] = [[]];
+
+  readonly keywords: readonly string[];
+
+  /**
+   * @param keywords 검색할 키워드 목록 (대소문자 변환은 호출 측에서 처리)
+   */
+  constructor(keywords: readonly string[]) {
+    this.keywords = keywords;
+
+    keywords.forEach((keyword, index) => {
+      if (keyword.length > 0) {
+        this.outputs[this.insert(keyword)].push(index);
+      }
+    });
+
+    this.buildFailureLinks();
+  }
+
+  /**
+   * 텍스트에 포함된 키워드 인덱스를 키워드 목록 순서대로 반환
+   */
+  matchedIndices(text: string): number[] {
+    const found = new Uint8Array(this.keywords.length);
+    let state = 0;
+
+    for (const char of text) {
+      state = this.next(state, char);
+      for (const index of this.outputs[state]) {
+        found[index] = 1;
+      }
+    }
+
+    const indices: number[] = [];
+    for (let i = 0; i < found.length; i++) {
+      if (found[i]) indices.push(i);
+    }
+    return indices;
+  }
+
+  private insert(keyword: string): number {
+    let node = 0;
+
+    for (const char of keyword) {
+      let child = this.transitions[node].get(char);
+      if (child === undefined) {
+        child = this.transitions.length;
+        this.transitions.push(new Map());
+        this.failure.push(0);
+        this.outputs.push([]);
+        this.transitions[node].set(char, child);
+      }
+      node = child;
+    }
+
+    return node;
+  }
+
+  private buildFailureLinks(): void {
+    const queue: number[] = [...this.transitions[0].values()];
+
+    for (let head = 0; head < queue.length; head++) {
+      const node = queue[head];
+
+      for (const [char, child] of this.transitions[node]) {
+        queue.push(child);
+
+        this.failure[child] = this.next(this.failure[node], char);
+        this.outputs[child].push(...this.outputs[this.failure[child]]);
+      }
+    }
+  }
+
+  private next(state: number, char: string): number {
+    let node = state;
+
+    while (node !== 0 && !this.transitions[node].has(char)) {
+      node = this.failure[node];
+    }
+
+    return this.transitions[node].get(char) ?? 0;
+  }
+}
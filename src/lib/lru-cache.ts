@@ -0,0 +1,48 @@
+/**
+ * 크기 제한 LRU 캐시
+ * Map의 삽입 순서를 이용해 조회/삽입/제거를 모두 O(1)로 처리
+ */
+
+export class LRUCache<K, V> {
+  private readonly entries = new Map<K, V>();
+
+  /**
+   * @param maxSize 보관할 최대 항목 수
+   */
+  constructor(private readonly maxSize: number) {}
+
+  /**
+   * 값 조회 (조회된 항목은 가장 최근 사용으로 갱신)
+   */
+  get(key: K): V | undefined {
+    if (!this.entries.has(key)) {
+      return undefined;
+    }
+
+    const value = this.entries.get(key) as V;
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+
+  /**
+   * 값 저장 (한도를 넘으면 가장 오래 사용되지 않은 항목 제거)
+   */
+  set(key: K, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+
+    if (this.entries.size > this.maxSize) {
+      const oldestKey = this.entries.keys().next().value as K;
+      this.entries.delete(oldestKey);
+    }
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
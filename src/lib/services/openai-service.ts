@@ -6,9 +6,11 @@
 import { 
   AI_CONFIG, 
   API_TIMEOUTS, 
+  API_RATE_LIMITS,
   BUSINESS_IDEA_DEFAULTS,
   STATUS_MESSAGES,
-  OPENROUTER_MODELS 
+  OPENROUTER_MODELS,
+  ENDPOINTS
 } from '@/lib/constants';
 import { 
   AppError, 
@@ -167,6 +169,52 @@ ${category ? `특히 "${category}" 분야에 초점을 맞춰 주세요.` : ''}
   }
 }
 
+type ModelTaskType = 'standard' | 'creative' | 'fast';
+
+type ChatCompletionOptions = Partial<{
+  model: string;
+  temperature: number;
+  maxTokens: number;
+  timeout: number;
+  taskType: ModelTaskType;
+}>;
+
+/** 기본값이 모두 적용된 Chat Completions 요청 */
+interface ChatCompletionRequest {
+  systemPrompt: string;
+  userPrompt: string;
+  model: string;
+  temperature: number;
+  maxTokens: number;
+  timeout: number;
+}
+
+/**
+ * 작업 유형별 모델 매핑 (비용 최적화)
+ */
+const MODEL_BY_TASK_TYPE: Readonly<Record<ModelTaskType, string>> = {
+  fast: OPENROUTER_MODELS.FALLBACK, // 무료 모델
+  creative: OPENROUTER_MODELS.CREATIVE, // 중간 비용
+  standard: OPENROUTER_MODELS.PRIMARY // 기본 비용 효율 모델
+};
+
+/**
+ * Retry-After 헤더(초 또는 HTTP 날짜)를 밀리초로 변환 (없거나 해석 불가 시 undefined)
+ */
+function parseRetryAfter(header: string | null): number | undefined {
+  if (!header) {
+    return undefined;
+  }
+
+  const seconds = Number(header);
+  if (Number.isFinite(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+
+  const date = Date.parse(header);
+  return Number.isNaN(date) ? undefined : Math.max(0, date - Date.now());
+}
+
 /**
  * OpenRouter AI API 클라이언트 클래스
  * HTTP 통신, 토큰 관리, 에러 처리, 스마트 모델 선택 담당
@@ -174,23 +222,46 @@ ${category ? `특히 "${category}" 분야에 초점을 맞춰 주세요.` : ''}
 class OpenAIClient {
   private config: OpenAIConfig;
 
+  /** 요청마다 변하지 않는 HTTP 헤더 (생성 시 한 번만 구성) */
+  private readonly requestHeaders: Record<string, string>;
+
+  /** 진행 중인 연결 예열 요청 (동시 호출 시 하나만 전송) */
+  private warmupRequest: Promise<void> | null = null;
+
+  /** OpenRouter 연결을 마지막으로 사용한 시각 (단조 시계, 유휴 연결 유지 여부 판단용) */
+  private lastConnectionUseAt = -Infinity;
+
   constructor(config: OpenAIConfig) {
     this.config = config;
+    this.requestHeaders = {
+      'Authorization': `Bearer ${config.apiKey}`,
+      'Content-Type': 'application/json',
+      'HTTP-Referer': ENDPOINTS.WEBSITE_URL,
+      'X-Title': 'IdeaSpark - AI Business Ideas'
+    };
   }
 
   /**
-   * 비용 최적화를 위한 스마트 모델 선택
+   * OpenRouter 연결 예열
+   * API 호출이 TCP/TLS 핸드셰이크까지 기다리지 않도록 연결 풀에 미리 연결을 열어 둠 (실패는 무시)
+   * 유휴 연결은 keep-alive 시간이 지나면 닫히므로, 최근에 사용한 연결이 없을 때만 다시 예열
    */
-  private selectOptimalModel(taskType: 'standard' | 'creative' | 'fast' = 'standard'): string {
-    switch (taskType) {
-      case 'fast':
-        return OPENROUTER_MODELS.FALLBACK; // 무료 모델
-      case 'creative':
-        return OPENROUTER_MODELS.CREATIVE; // 중간 비용
-      case 'standard':
-      default:
-        return OPENROUTER_MODELS.PRIMARY; // 기본 비용 효율 모델
+  warmup(): Promise<void> {
+    if (performance.now() - this.lastConnectionUseAt < API_TIMEOUTS.KEEP_ALIVE_IDLE) {
+      return Promise.resolve();
     }
+
+    this.warmupRequest ??= fetch(ENDPOINTS.OPENROUTER_MODELS, { method: 'HEAD' })
+      .then(() => { this.lastConnectionUseAt = performance.now(); }, () => undefined)
+      .finally(() => { this.warmupRequest = null; });
+    return this.warmupRequest;
+  }
+
+  /**
+   * 비용 최적화를 위한 스마트 모델 선택
+   */
+  private selectOptimalModel(taskType: ModelTaskType = 'standard'): string {
+    return MODEL_BY_TASK_TYPE[taskType] ?? OPENROUTER_MODELS.PRIMARY;
   }
 
   /**
@@ -199,31 +270,79 @@ class OpenAIClient {
   async callChatCompletion(
     systemPrompt: string,
     userPrompt: string,
-    options?: Partial<{
-      model: string;
-      temperature: number;
-      maxTokens: number;
-      timeout: number;
-      taskType: 'standard' | 'creative' | 'fast';
-    }>
+    options?: ChatCompletionOptions
   ): Promise<OpenAICallResult> {
-    const startTime = Date.now();
-    
-    try {
-      const controller = new AbortController();
-      const timeout = options?.timeout || this.config.timeout;
-      const timeoutId = setTimeout(() => controller.abort(), timeout);
+    return this.executeChatCompletion({
+      systemPrompt,
+      userPrompt,
+      model: options?.model || this.selectOptimalModel(options?.taskType),
+      temperature: options?.temperature ?? this.config.temperature,
+      maxTokens: options?.maxTokens || this.config.maxTokens,
+      timeout: options?.timeout || this.config.timeout
+    });
+  }
+
+  /**
+   * 실제 API 요청 수행 (일시적 오류는 재시도)
+   */
+  private async executeChatCompletion(request: ChatCompletionRequest): Promise<OpenAICallResult> {
+    for (let attempt = 0; ; attempt++) {
+      try {
+        return await this.sendChatCompletion(request);
+      } catch (error) {
+        const retryDelay = this.getRetryDelay(error, attempt);
+        if (retryDelay === null) {
+          throw error;
+        }
+
+        await new Promise(resolve => setTimeout(resolve, retryDelay));
+      }
+    }
+  }
+
+  /**
+   * 재시도 대기 시간 계산 (재시도 대상이 아니거나 횟수를 모두 쓰면 null)
+   * Retry-After 헤더가 있으면 따르고, 없으면 full jitter 지수 백오프로 동시 재시도가 몰리지 않게 분산
+   */
+  private getRetryDelay(error: unknown, attempt: number): number | null {
+    if (
+      attempt >= API_RATE_LIMITS.OPENROUTER_MAX_RETRIES ||
+      !(error instanceof AppError) ||
+      !error.context?.retryable
+    ) {
+      return null;
+    }
+
+    const retryAfterMs = error.context.retryAfterMs;
+    if (typeof retryAfterMs === 'number') {
+      return retryAfterMs <= API_RATE_LIMITS.OPENROUTER_MAX_WAIT ? retryAfterMs : null;
+    }
 
-      const response = await fetch('https://openrouter.ai/api/v1/chat/completions', {
+    const backoffCeiling = Math.min(
+      API_RATE_LIMITS.OPENROUTER_RETRY_MAX_DELAY,
+      API_RATE_LIMITS.OPENROUTER_RETRY_BASE_DELAY * 2 ** attempt
+    );
+    return Math.random() * backoffCeiling;
+  }
+
+  /**
+   * API 요청 1회 수행
+   * 요청이 전달되지 못한 네트워크 오류와 429/5xx 응답만 retryable로 표시
+   * 타임아웃과 응답 본문 파싱 실패는 이미 처리·과금 중일 수 있는 요청이므로 재시도하지 않음
+   */
+  private async sendChatCompletion(request: ChatCompletionRequest): Promise<OpenAICallResult> {
+    const { systemPrompt, userPrompt, model, temperature, maxTokens, timeout } = request;
+    const startTime = performance.now();
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), timeout);
+
+    let response: Response;
+    try {
+      response = await fetch(ENDPOINTS.OPENROUTER_CHAT_COMPLETIONS, {
         method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${this.config.apiKey}`,
-          'Content-Type': 'application/json',
-          'HTTP-Referer': 'https://ideaspark-v2.vercel.app',
-          'X-Title': 'IdeaSpark - AI Business Ideas'
-        },
+        headers: this.requestHeaders,
         body: JSON.stringify({
-          model: options?.model || this.selectOptimalModel(options?.taskType),
+          model,
           messages: [
             {
               role: 'system',
@@ -234,24 +353,38 @@ class OpenAIClient {
               content: userPrompt
             }
           ],
-          max_tokens: options?.maxTokens || this.config.maxTokens,
-          temperature: options?.temperature || this.config.temperature,
+          max_tokens: maxTokens,
+          temperature,
         }),
         signal: controller.signal
       });
-
+    } catch (error) {
+      // fetch 자체의 실패: 네트워크 오류(TypeError) 또는 타임아웃(AbortError)
+      // 타임아웃은 서버가 이미 생성 중일 수 있고, 재시도하면 전체 대기 시간도 타임아웃의 배수로 늘어남
+      const timedOut = controller.signal.aborted;
+      throw ErrorFactory.externalApi('OpenAI', timedOut ? `Request timed out after ${timeout}ms` : 'Failed to call OpenAI API', {
+        originalError: error instanceof Error ? error.message : String(error),
+        responseTime: Math.round(performance.now() - startTime),
+        retryable: !timedOut
+      });
+    } finally {
       clearTimeout(timeoutId);
+    }
 
-      if (!response.ok) {
-        throw ErrorFactory.externalApi('OpenAI', `API request failed with status ${response.status}`, {
-          status: response.status,
-          statusText: response.statusText
-        });
-      }
+    if (!response.ok) {
+      throw ErrorFactory.externalApi('OpenAI', `API request failed with status ${response.status}`, {
+        status: response.status,
+        statusText: response.statusText,
+        retryable: response.status === 429 || response.status >= 500,
+        retryAfterMs: parseRetryAfter(response.headers.get('retry-after'))
+      });
+    }
 
+    try {
       const data = await response.json();
       const content = data.choices[0]?.message?.content || '';
-      const responseTime = Date.now() - startTime;
+      const responseTime = Math.round(performance.now() - startTime);
+      this.lastConnectionUseAt = performance.now();
 
       return {
         success: true,
@@ -261,20 +394,50 @@ class OpenAIClient {
         responseTime
       };
     } catch (error) {
-      const responseTime = Date.now() - startTime;
-      
-      if (error instanceof AppError) {
-        throw error;
-      }
-      
-      throw ErrorFactory.externalApi('OpenAI', 'Failed to call OpenAI API', {
+      throw ErrorFactory.externalApi('OpenAI', 'Failed to parse OpenAI API response', {
         originalError: error instanceof Error ? error.message : String(error),
-        responseTime
+        responseTime: Math.round(performance.now() - startTime)
       });
     }
   }
 }
 
+/**
+ * API 실패시 사용하는 Mock 비즈니스 아이디어 (호출마다 재생성하지 않도록 모듈 상수로 유지)
+ * 배열 필드는 공유되므로 반환 시 복사해서 사용
+ */
+const MOCK_BUSINESS_IDEAS: ReadonlyArray<Omit<BusinessIdeaResponse, 'confidenceScore' | 'estimatedCost' | 'timeToMarket'>> = [
+  {
+    title: 'AI 스마트 학습 플랫폼',
+    description: '개인 맞춤형 AI 튜터가 학습자의 진도와 이해도를 실시간으로 분석하여 최적의 학습 경로를 제공하는 플랫폼입니다.',
+    targetMarket: '고등학생, 대학생, 직장인 (평생 학습)',
+    businessModel: '월간 구독 모델 + 프리미엄 1:1 튜터링',
+    keyFeatures: ['AI 맞춤 학습', '실시간 진도 분석', '학습 효율 최적화'],
+    marketSize: '국내 에듀테크 시장 2조원',
+    competitiveAdvantage: '개인화된 AI 알고리즘',
+    tags: ['에듀테크', 'AI', '개인화']
+  },
+  {
+    title: '원격 근무 협업 도구',
+    description: '분산된 팀의 효율적인 협업을 위한 통합 플랫폼으로, 실시간 커뮤니케이션과 프로젝트 관리를 제공합니다.',
+    targetMarket: '중소기업, 스타트업, 원격 근무팀',
+    businessModel: '팀 단위 월간 구독',
+    keyFeatures: ['실시간 협업', '프로젝트 추적', '성과 분석'],
+    marketSize: '글로벌 협업 도구 시장 150억 달러',
+    competitiveAdvantage: '사용자 친화적 인터페이스',
+    tags: ['협업', '원격근무', 'SaaS']
+  }
+];
+
+/** 응답에 값이 없을 때 사용하는 기본 핵심 기능 */
+const DEFAULT_KEY_FEATURES = ['기능 1', '기능 2', '기능 3'];
+
+/** 응답에 값이 없을 때 사용하는 기본 태그 */
+const DEFAULT_TAGS = ['혁신', '기술', '서비스'];
+
+/** 응답의 JSON 코드 블록 여는/닫는 펜스 (한 번의 치환으로 제거) */
+const CODE_FENCE_PATTERN = /```json\n?|```\n?$/g;
+
 /**
  * AI 응답 파싱 및 검증 클래스
  * JSON 파싱, 데이터 검증, fallback 처리 담당
@@ -284,23 +447,35 @@ class ResponseValidator {
    * AI 응답을 JSON으로 파싱하고 검증
    */
   static parseBusinessIdeaResponse(rawResponse: string): BusinessIdeaResponse {
-    try {
-      // JSON 응답에서 코드 블록 제거
-      const cleanResponse = rawResponse
-        .replace(/```json\n?/g, '')
-        .replace(/```\n?$/g, '')
-        .trim();
+    // 순수 JSON 응답은 그대로 파싱하고, 코드 블록으로 감싼 경우에만 펜스 제거
+    const trimmedResponse = rawResponse.trim();
+    const cleanResponse = trimmedResponse.startsWith('{') && trimmedResponse.endsWith('}')
+      ? trimmedResponse
+      : rawResponse.replace(CODE_FENCE_PATTERN, '').trim();
 
-      const ideaData = JSON.parse(cleanResponse);
-      
-      // 데이터 검증 및 기본값 적용
-      return this.validateBusinessIdea(ideaData);
+    let ideaData: unknown;
+    try {
+      ideaData = JSON.parse(cleanResponse);
     } catch (error) {
-      throw ErrorFactory.businessLogic('Failed to parse AI response as JSON', {
-        rawResponse: rawResponse.substring(0, 200) + '...',
-        error: error instanceof Error ? error.message : String(error)
-      });
+      throw this.parseError(rawResponse, error instanceof Error ? error.message : String(error));
+    }
+
+    if (typeof ideaData !== 'object' || ideaData === null) {
+      throw this.parseError(rawResponse, 'Response is not a JSON object');
     }
+
+    // 데이터 검증 및 기본값 적용
+    return this.validateBusinessIdea(ideaData);
+  }
+
+  /**
+   * 응답 파싱 실패 에러 생성
+   */
+  private static parseError(rawResponse: string, reason: string): AppError {
+    return ErrorFactory.businessLogic('Failed to parse AI response as JSON', {
+      rawResponse: rawResponse.substring(0, 200) + '...',
+      error: reason
+    });
   }
 
   /**
@@ -312,13 +487,13 @@ class ResponseValidator {
       description: data.description || '상세 설명이 생성되지 않았습니다.',
       targetMarket: data.targetMarket || BUSINESS_IDEA_DEFAULTS.DEFAULT_TARGET_MARKET,
       businessModel: data.businessModel || '구독 기반 모델',
-      keyFeatures: Array.isArray(data.keyFeatures) ? data.keyFeatures : ['기능 1', '기능 2', '기능 3'],
+      keyFeatures: Array.isArray(data.keyFeatures) ? data.keyFeatures : [...DEFAULT_KEY_FEATURES],
       marketSize: data.marketSize || '중소 규모',
       competitiveAdvantage: data.competitiveAdvantage || '혁신적인 접근 방식',
       confidenceScore: typeof data.confidenceScore === 'number' ? 
         Math.max(AI_CONFIG.MIN_CONFIDENCE_SCORE, Math.min(data.confidenceScore, AI_CONFIG.MAX_CONFIDENCE_SCORE)) : 
         AI_CONFIG.DEFAULT_CONFIDENCE_SCORE,
-      tags: Array.isArray(data.tags) ? data.tags : ['혁신', '기술', '서비스'],
+      tags: Array.isArray(data.tags) ? data.tags : [...DEFAULT_TAGS],
       estimatedCost: data.estimatedCost || BUSINESS_IDEA_DEFAULTS.DEFAULT_COST,
       timeToMarket: data.timeToMarket || BUSINESS_IDEA_DEFAULTS.DEFAULT_TIME_TO_MARKET,
       painPointsAddressed: Array.isArray(data.painPointsAddressed) ? data.painPointsAddressed : undefined,
@@ -330,33 +505,12 @@ class ResponseValidator {
    * Mock 비즈니스 아이디어 생성 (API 실패시 fallback)
    */
   static createMockBusinessIdea(request: BusinessIdeaRequest): BusinessIdeaResponse {
-    const mockIdeas = [
-      {
-        title: 'AI 스마트 학습 플랫폼',
-        description: '개인 맞춤형 AI 튜터가 학습자의 진도와 이해도를 실시간으로 분석하여 최적의 학습 경로를 제공하는 플랫폼입니다.',
-        targetMarket: '고등학생, 대학생, 직장인 (평생 학습)',
-        businessModel: '월간 구독 모델 + 프리미엄 1:1 튜터링',
-        keyFeatures: ['AI 맞춤 학습', '실시간 진도 분석', '학습 효율 최적화'],
-        marketSize: '국내 에듀테크 시장 2조원',
-        competitiveAdvantage: '개인화된 AI 알고리즘',
-        tags: ['에듀테크', 'AI', '개인화']
-      },
-      {
-        title: '원격 근무 협업 도구',
-        description: '분산된 팀의 효율적인 협업을 위한 통합 플랫폼으로, 실시간 커뮤니케이션과 프로젝트 관리를 제공합니다.',
-        targetMarket: '중소기업, 스타트업, 원격 근무팀',
-        businessModel: '팀 단위 월간 구독',
-        keyFeatures: ['실시간 협업', '프로젝트 추적', '성과 분석'],
-        marketSize: '글로벌 협업 도구 시장 150억 달러',
-        competitiveAdvantage: '사용자 친화적 인터페이스',
-        tags: ['협업', '원격근무', 'SaaS']
-      }
-    ];
-
-    const selectedIdea = mockIdeas[Math.floor(Math.random() * mockIdeas.length)];
+    const selectedIdea = MOCK_BUSINESS_IDEAS[Math.floor(Math.random() * MOCK_BUSINESS_IDEAS.length)];
     
     return {
       ...selectedIdea,
+      keyFeatures: [...selectedIdea.keyFeatures],
+      tags: [...selectedIdea.tags],
       confidenceScore: AI_CONFIG.DEFAULT_CONFIDENCE_SCORE,
       estimatedCost: BUSINESS_IDEA_DEFAULTS.DEFAULT_COST,
       timeToMarket: BUSINESS_IDEA_DEFAULTS.DEFAULT_TIME_TO_MARKET
@@ -371,6 +525,31 @@ class ResponseValidator {
 export class OpenAIService {
   private client: OpenAIClient;
 
+  /**
+   * 서비스 정보 (생성 이후 변하지 않으므로 한 번만 구성)
+   */
+  private readonly serviceInfo = {
+    service: 'OpenAIService',
+    version: '2.0',
+    features: [
+      'Single pain point idea generation',
+      'Trending pain points comprehensive analysis',
+      'Prompt template management',
+      'Response validation and fallback',
+      'Error handling with retry logic',
+      'Performance monitoring'
+    ],
+    models: {
+      default: process.env.OPENAI_MODEL || 'gpt-4o-mini',
+      available: ['gpt-4o-mini', 'gpt-4-turbo-preview', 'gpt-3.5-turbo']
+    },
+    limits: {
+      maxTokens: AI_CONFIG.TARGET_RESPONSE_TIME * 1000, // 대략적인 계산
+      timeout: API_TIMEOUTS.OPENAI_API,
+      confidenceScoreRange: `${AI_CONFIG.MIN_CONFIDENCE_SCORE}-${AI_CONFIG.MAX_CONFIDENCE_SCORE}`
+    }
+  };
+
   constructor() {
     const apiKey = process.env.OPENAI_API_KEY || '';
     
@@ -581,7 +760,7 @@ export class OpenAIService {
     
     try {
       const result = await this.client.callChatCompletion(systemPrompt, prompt, {
-        temperature: options?.temperature || 0.7,
+        temperature: options?.temperature ?? 0.7,
         maxTokens: options?.maxTokens || 4000
       });
       
@@ -597,6 +776,13 @@ export class OpenAIService {
     }
   }
 
+  /**
+   * API 연결 예열 (다른 I/O를 시작하기 전에 호출해 핸드셰이크와 겹치게 함)
+   */
+  warmup(): void {
+    void this.client.warmup();
+  }
+
   async testConnection(): Promise<{ success: boolean; message: string; details?: any }> {
     try {
       const result = await this.client.callChatCompletion(
@@ -629,27 +815,7 @@ export class OpenAIService {
    * 서비스 정보 반환
    */
   getServiceInfo(): object {
-    return {
-      service: 'OpenAIService',
-      version: '2.0',
-      features: [
-        'Single pain point idea generation',
-        'Trending pain points comprehensive analysis',
-        'Prompt template management',
-        'Response validation and fallback',
-        'Error handling with retry logic',
-        'Performance monitoring'
-      ],
-      models: {
-        default: process.env.OPENAI_MODEL || 'gpt-4o-mini',
-        available: ['gpt-4o-mini', 'gpt-4-turbo-preview', 'gpt-3.5-turbo']
-      },
-      limits: {
-        maxTokens: AI_CONFIG.TARGET_RESPONSE_TIME * 1000, // 대략적인 계산
-        timeout: API_TIMEOUTS.OPENAI_API,
-        confidenceScoreRange: `${AI_CONFIG.MIN_CONFIDENCE_SCORE}-${AI_CONFIG.MAX_CONFIDENCE_SCORE}`
-      }
-    };
+    return { ...this.serviceInfo };
   }
 }
 
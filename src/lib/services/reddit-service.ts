@@ -3,9 +3,11 @@
  * 갈증포인트 수집을 위한 체계화된 Reddit 데이터 처리
  */
 
+import { createHash } from 'crypto';
 import { 
   COLLECTION_LIMITS, 
   API_TIMEOUTS, 
+  API_RATE_LIMITS,
   CATEGORIES,
   STATUS_MESSAGES 
 } from '@/lib/constants';
@@ -15,6 +17,9 @@ import {
   ErrorLogger,
   ErrorCategory 
 } from '@/lib/error-handler';
+import { selectTopK } from '@/lib/collections';
+import { KeywordMatcher } from '@/lib/keyword-matcher';
+import { LRUCache } from '@/lib/lru-cache';
 
 // 타입 정의
 export interface RedditPost {
@@ -213,13 +218,19 @@ class RedditDataCollector {
     const allPosts: RedditPost[] = [];
     const errors: Array<{ subreddit: string; error: string }> = [];
 
+    let lastRequestAt = -Infinity;
+
     for (const subreddit of subreddits) {
+      // API 제한을 피하기 위해 요청 시작 간격만 유지 (첫 요청 전, 마지막 요청 후에는 대기 없음)
+      const waitMs = lastRequestAt + API_RATE_LIMITS.REDDIT_REQUEST_INTERVAL - performance.now();
+      if (waitMs > 0) {
+        await new Promise(resolve => setTimeout(resolve, waitMs));
+      }
+      lastRequestAt = performance.now();
+
       try {
         const posts = await this.fetchSubreddit(subreddit, 'hot', postsPerSubreddit);
         allPosts.push(...posts);
-        
-        // API 제한을 피하기 위한 지연
-        await new Promise(resolve => setTimeout(resolve, 1000));
       } catch (error) {
         const errorMsg = error instanceof Error ? error.message : String(error);
         errors.push({ subreddit, error: errorMsg });
@@ -247,6 +258,32 @@ class RedditDataCollector {
   }
 }
 
+/**
+ * 정규식 특수문자 이스케이프
+ */
+function escapeRegExp(text: string): string {
+  return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+/**
+ * 게시물 텍스트 단일 스캔 결과
+ */
+interface TextScanResult {
+  negativeCount: number;
+  keywords: string[];
+  /** 카테고리 인덱스별 매칭 여부 (categoryNames 기준) */
+  contentCategories: Uint8Array;
+}
+
+/**
+ * 게시물 분석 결과 (트렌드 스코어 제외, 캐시에서 공유되므로 읽기 전용)
+ */
+interface PostAnalysis {
+  readonly sentimentScore: number;
+  readonly keywords: readonly string[];
+  readonly category: string;
+}
+
 /**
  * Reddit 데이터 분석 클래스
  * 갈증포인트 추출, 키워드 분석, 카테고리 분류 담당
@@ -259,6 +296,11 @@ class RedditDataAnalyzer {
     'why does', 'how to', 'can\'t figure', 'doesn\'t work'
   ];
 
+  /** 갈증포인트 키워드 전체를 한 번에 검사하는 정규식 (생성 시 한 번만 컴파일) */
+  private readonly painKeywordPattern = new RegExp(
+    this.painKeywords.map(keyword => escapeRegExp(keyword.toLowerCase())).join('|')
+  );
+
   private readonly negativeKeywords = [
     'frustrated', 'annoying', 'terrible', 'awful', 'hate',
     '짜증', '힘들어', '최악', '싫어', '화나'
@@ -277,6 +319,9 @@ class RedditDataAnalyzer {
     '스타트업', '비즈니스', '마케팅', '고객', '서비스', '제품'
   ];
 
+  /** 키워드 추출 대상 (기술 + 비즈니스, 생성 시 한 번만 병합) */
+  private readonly extractableKeywords = [...this.techKeywords, ...this.businessKeywords];
+
   private readonly categoryMappings = {
     'development': ['programming', 'webdev', 'javascript', 'python', 'reactjs', 'coding'],
     'productivity': ['productivity', 'getmotivated', 'lifehacks', 'selfimprovement'],
@@ -286,6 +331,33 @@ class RedditDataAnalyzer {
     'general': ['askreddit', 'nostupidquestions', 'explainlikeimfive']
   };
 
+  /** 카테고리 이름 (categoryMappings 선언 순서 = 분류 우선순위) */
+  private readonly categoryNames = Object.keys(this.categoryMappings);
+
+  /** 카테고리 키워드 역색인: 카테고리 키워드 순번 → 카테고리 인덱스 */
+  private readonly categoryTermOwners = Object.values(this.categoryMappings)
+    .flatMap((subs, categoryIndex) => subs.map(() => categoryIndex));
+
+  /**
+   * 감정/키워드/카테고리 분석 용어를 텍스트 한 번 스캔으로 찾는 매처
+   * 인덱스 구간: [부정 키워드 | 추출 대상 키워드 | 카테고리 키워드]
+   */
+  private readonly analysisMatcher = new KeywordMatcher([
+    ...this.negativeKeywords.map(keyword => keyword.toLowerCase()),
+    ...this.extractableKeywords.map(keyword => keyword.toLowerCase()),
+    ...Object.values(this.categoryMappings).flat()
+  ]);
+
+  private readonly extractableKeywordOffset = this.negativeKeywords.length;
+  private readonly categoryTermOffset = this.extractableKeywordOffset + this.extractableKeywords.length;
+
+  private readonly subredditCategoryCache = new Map<string, Uint8Array>();
+
+  /** 게시물 내용 해시별 분석 결과 (갈증포인트가 아닌 게시물은 null) */
+  private readonly analysisCache = new LRUCache<string, PostAnalysis | null>(
+    COLLECTION_LIMITS.POST_ANALYSIS_CACHE_SIZE
+  );
+
   /**
    * 게시물에서 갈증포인트 추출
    */
@@ -293,26 +365,24 @@ class RedditDataAnalyzer {
     const painPoints: PainPoint[] = [];
     
     for (const post of posts) {
-      const title = post.title.toLowerCase();
-      const content = (post.selftext || '').toLowerCase();
-      const fullText = `${title} ${content}`;
+      // 본문이 짧은 게시물은 키워드 검사 전에 바로 제외
+      if (!post.selftext || post.selftext.length <= 50) {
+        continue;
+      }
 
-      // 갈증포인트 키워드가 포함된 게시물인지 확인
-      const hasPainKeywords = this.painKeywords.some(keyword => 
-        fullText.includes(keyword.toLowerCase())
-      );
+      const analysis = this.analyzePost(post);
 
-      // 내용이 충분히 있고 갈증포인트 키워드가 포함된 경우만 처리
-      if (hasPainKeywords && content.length > 50) {
+      // 갈증포인트 키워드가 포함된 경우만 처리
+      if (analysis) {
         const painPoint: PainPoint = {
           title: post.title,
-          content: post.selftext || post.title,
+          content: post.selftext,
           source: 'reddit',
           source_url: `https://reddit.com${post.url}`,
-          sentiment_score: this.calculateSentimentScore(fullText),
+          sentiment_score: analysis.sentimentScore,
           trend_score: this.calculateTrendScore(post),
-          keywords: this.extractKeywords(fullText),
-          category: this.categorizePost(post.subreddit, fullText)
+          keywords: [...analysis.keywords],
+          category: analysis.category
         };
 
         painPoints.push(painPoint);
@@ -323,13 +393,77 @@ class RedditDataAnalyzer {
   }
 
   /**
-   * 감정 스코어 계산 (0.1 ~ 1.0)
+   * 게시물 분석 (갈증포인트가 아니면 null, 결과는 내용 해시별로 캐시)
    */
-  private calculateSentimentScore(text: string): number {
-    const negativeCount = this.negativeKeywords.filter(keyword => 
-      text.includes(keyword.toLowerCase())
-    ).length;
+  private analyzePost(post: RedditPost): PostAnalysis | null {
+    const cacheKey = this.getAnalysisCacheKey(post);
+    const cached = this.analysisCache.get(cacheKey);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    // 제목과 본문을 합친 뒤 한 번만 소문자로 변환
+    const fullText = `${post.title} ${post.selftext}`.toLowerCase();
+
+    // 갈증포인트 키워드가 포함된 게시물인지 확인
+    let analysis: PostAnalysis | null = null;
+
+    if (this.painKeywordPattern.test(fullText)) {
+      const scan = this.scanText(fullText);
+
+      analysis = {
+        sentimentScore: this.calculateSentimentScore(scan.negativeCount),
+        keywords: scan.keywords,
+        category: this.categorizePost(post.subreddit, scan.contentCategories)
+      };
+    }
 
+    this.analysisCache.set(cacheKey, analysis);
+    return analysis;
+  }
+
+  /**
+   * 분석 결과에 영향을 주는 필드(서브레딧, 제목, 본문)만으로 만든 캐시 키
+   * 게시물이 수정되면 키가 바뀌어 이전 분석 결과를 재사용하지 않음
+   */
+  private getAnalysisCacheKey(post: RedditPost): string {
+    return createHash('sha1')
+      .update(post.subreddit)
+      .update('\0')
+      .update(post.title)
+      .update('\0')
+      .update(post.selftext)
+      .digest('base64');
+  }
+
+  /**
+   * 소문자 텍스트를 한 번 스캔하여 감정/키워드/카테고리 분석 재료 수집
+   */
+  private scanText(text: string): TextScanResult {
+    let negativeCount = 0;
+    const keywords: string[] = [];
+    const contentCategories = new Uint8Array(this.categoryNames.length);
+
+    // 매칭 인덱스는 오름차순이므로 키워드는 목록 순서대로 최대 5개 수집
+    for (const index of this.analysisMatcher.matchedIndices(text)) {
+      if (index < this.extractableKeywordOffset) {
+        negativeCount++;
+      } else if (index < this.categoryTermOffset) {
+        if (keywords.length < 5) {
+          keywords.push(this.extractableKeywords[index - this.extractableKeywordOffset]);
+        }
+      } else {
+        contentCategories[this.categoryTermOwners[index - this.categoryTermOffset]] = 1;
+      }
+    }
+
+    return { negativeCount, keywords, contentCategories };
+  }
+
+  /**
+   * 감정 스코어 계산 (0.1 ~ 1.0)
+   */
+  private calculateSentimentScore(negativeCount: number): number {
     // 부정적 키워드가 많을수록 낮은 점수
     return Math.max(0.1, 0.5 - (negativeCount * 0.1));
   }
@@ -346,33 +480,76 @@ class RedditDataAnalyzer {
   }
 
   /**
-   * 키워드 추출 (최대 5개)
+   * 게시물 카테고리 분류
    */
-  private extractKeywords(text: string): string[] {
-    const allKeywords = [...this.techKeywords, ...this.businessKeywords];
-    
-    return allKeywords.filter(keyword => 
-      text.toLowerCase().includes(keyword.toLowerCase())
-    ).slice(0, 5);
+  private categorizePost(subreddit: string, contentCategories: Uint8Array): string {
+    const subredditCategories = this.getSubredditCategories(subreddit);
+
+    for (let i = 0; i < this.categoryNames.length; i++) {
+      if (subredditCategories[i] || contentCategories[i]) {
+        return this.categoryNames[i];
+      }
+    }
+
+    return 'general';
   }
 
   /**
-   * 게시물 카테고리 분류
+   * 서브레딧 이름으로 매칭되는 카테고리 인덱스별 여부 (서브레딧별 캐시)
    */
-  private categorizePost(subreddit: string, content: string): string {
-    const subredditLower = subreddit.toLowerCase();
-    const contentLower = content.toLowerCase();
+  private getSubredditCategories(subreddit: string): Uint8Array {
+    const cached = this.subredditCategoryCache.get(subreddit);
+    if (cached) return cached;
 
-    for (const [category, subs] of Object.entries(this.categoryMappings)) {
-      if (subs.some(sub => subredditLower.includes(sub) || contentLower.includes(sub))) {
-        return category;
+    const subredditLower = subreddit.toLowerCase();
+    const categories = new Uint8Array(this.categoryNames.length);
+    Object.values(this.categoryMappings).forEach((subs, categoryIndex) => {
+      if (subs.some(sub => subredditLower.includes(sub))) {
+        categories[categoryIndex] = 1;
       }
-    }
+    });
 
-    return 'general';
+    this.subredditCategoryCache.set(subreddit, categories);
+    return categories;
   }
 }
 
+/**
+ * 수집 실패 시 반환하는 샘플 갈증포인트 (모듈 로드 시 한 번만 생성)
+ */
+const FALLBACK_PAIN_POINTS: ReadonlyArray<PainPoint> = [
+  {
+    title: "React useState가 업데이트 안되는 문제",
+    content: "setState를 호출해도 컴포넌트가 리렌더링되지 않습니다. 클로저 문제인 것 같은데 어떻게 해결하나요?",
+    source: 'reddit',
+    source_url: 'https://reddit.com/r/reactjs/sample1',
+    sentiment_score: 0.3,
+    trend_score: 0.85,
+    keywords: ['React', 'useState', 'setState', '리렌더링', '클로저'],
+    category: 'development'
+  },
+  {
+    title: "스타트업 초기 고객 확보 방법",
+    content: "MVP를 만들었는데 첫 고객을 어떻게 확보해야 할지 모르겠습니다. 마케팅 예산이 거의 없는 상황에서 효과적인 방법이 있을까요?",
+    source: 'reddit',
+    source_url: 'https://reddit.com/r/startups/sample2',
+    sentiment_score: 0.4,
+    trend_score: 0.78,
+    keywords: ['스타트업', 'MVP', '고객 확보', '마케팅', '예산'],
+    category: 'business'
+  },
+  {
+    title: "Next.js API Routes 성능 최적화",
+    content: "API 라우트가 너무 느려서 사용자 경험이 좋지 않습니다. 캐싱과 최적화 방법을 찾고 있습니다.",
+    source: 'reddit',
+    source_url: 'https://reddit.com/r/nextjs/sample3',
+    sentiment_score: 0.35,
+    trend_score: 0.72,
+    keywords: ['Next.js', 'API Routes', '성능', '최적화', '캐싱'],
+    category: 'development'
+  }
+];
+
 /**
  * Reddit 서비스 메인 클래스
  * 전체 갈증포인트 수집 프로세스 관리
@@ -431,10 +608,8 @@ export class RedditService {
       // 갈증포인트 추출 및 분석
       const painPoints = this.dataAnalyzer.extractPainPoints(posts);
       
-      // 트렌드 스코어로 정렬하고 제한된 수만 반환
-      const sortedPainPoints = painPoints
-        .sort((a, b) => b.trend_score - a.trend_score)
-        .slice(0, limit);
+      // 트렌드 스코어 상위 항목만 선택 (전체 정렬 없이)
+      const sortedPainPoints = selectTopK(painPoints, limit, painPoint => painPoint.trend_score);
 
       console.log(`✅ Successfully collected ${sortedPainPoints.length} pain points from Reddit`);
       
@@ -486,40 +661,10 @@ export class RedditService {
    * Fallback 갈증포인트 (API 실패시 사용)
    */
   private getFallbackPainPoints(limit: number): PainPoint[] {
-    const fallbackData = [
-      {
-        title: "React useState가 업데이트 안되는 문제",
-        content: "setState를 호출해도 컴포넌트가 리렌더링되지 않습니다. 클로저 문제인 것 같은데 어떻게 해결하나요?",
-        source: 'reddit' as const,
-        source_url: 'https://reddit.com/r/reactjs/sample1',
-        sentiment_score: 0.3,
-        trend_score: 0.85,
-        keywords: ['React', 'useState', 'setState', '리렌더링', '클로저'],
-        category: 'development'
-      },
-      {
-        title: "스타트업 초기 고객 확보 방법",
-        content: "MVP를 만들었는데 첫 고객을 어떻게 확보해야 할지 모르겠습니다. 마케팅 예산이 거의 없는 상황에서 효과적인 방법이 있을까요?",
-        source: 'reddit' as const,
-        source_url: 'https://reddit.com/r/startups/sample2',
-        sentiment_score: 0.4,
-        trend_score: 0.78,
-        keywords: ['스타트업', 'MVP', '고객 확보', '마케팅', '예산'],
-        category: 'business'
-      },
-      {
-        title: "Next.js API Routes 성능 최적화",
-        content: "API 라우트가 너무 느려서 사용자 경험이 좋지 않습니다. 캐싱과 최적화 방법을 찾고 있습니다.",
-        source: 'reddit' as const,
-        source_url: 'https://reddit.com/r/nextjs/sample3',
-        sentiment_score: 0.35,
-        trend_score: 0.72,
-        keywords: ['Next.js', 'API Routes', '성능', '최적화', '캐싱'],
-        category: 'development'
-      }
-    ];
-
-    return fallbackData.slice(0, limit);
+    // 템플릿은 공유하고 호출자가 수정할 수 있는 배열 필드만 복사
+    return FALLBACK_PAIN_POINTS
+      .slice(0, limit)
+      .map(painPoint => ({ ...painPoint, keywords: [...painPoint.keywords] }));
   }
 
   /**